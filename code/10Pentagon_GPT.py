@@ -1,43 +1,28 @@
 # pentagon_loop_by_edge3.py
-# Pydroid OK (matplotlib必要)
+# Pydroid OK (matplotlib, numpy必要)
 # 出力: pentagon_edge3_loop.png
 
 import math
+import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 
+from pentagon_kernel import build_ring, pentagon_offsets
 
-def rot(v, ang):
-    x, y = v
-    c, s = math.cos(ang), math.sin(ang)
-    return (c * x - s * y, s * x + c * y)
 
-def add(a, b): return (a[0] + b[0], a[1] + b[1])
 def sub(a, b): return (a[0] - b[0], a[1] - b[1])
 def norm(a): return math.hypot(a[0], a[1])
 
-def build_pentagon_from_edge(p0, v01, turn_sign=+1):
-    """
-    p0: 頂点0
-    v01: 頂点0->頂点1 ベクトル（長さ=辺長）
-    turn_sign: +1 で CCW に 72°ずつ回す、-1 で CW
-    戻り値: 頂点 v0..v4 (5点)
-    """
-    ext = turn_sign * (2 * math.pi / 5)  # 72°
-    pts = [p0]
-    v = v01
-    p = p0
-    for _ in range(4):  # v1..v4
-        p = add(p, v)
-        pts.append(p)
-        v = rot(v, ext)
-    return pts
-
 def plot_polys(polys, fname, title):
+    # 各五角形の先頭頂点を末尾に追加して閉じた折れ線に: (N, 6, 2)
+    polys = np.asarray(polys, dtype=float)
+    closed = np.concatenate([polys, polys[:, :1]], axis=1)
+
+    # 全ての五角形を1つの LineCollection で描画（色は通常の色サイクル）
+    colors = plt.rcParams["axes.prop_cycle"].by_key()["color"]
     fig, ax = plt.subplots(figsize=(7, 7))
-    for poly in polys:
-        xs = [p[0] for p in poly] + [poly[0][0]]
-        ys = [p[1] for p in poly] + [poly[0][1]]
-        ax.plot(xs, ys, linewidth=2)
+    ax.add_collection(LineCollection(closed, colors=colors, linewidths=2))
+    ax.autoscale_view()
     ax.set_aspect("equal", adjustable="box")
     ax.grid(True, linewidth=0.5)
     ax.set_title(title)
@@ -49,31 +34,19 @@ def plot_polys(polys, fname, title):
 def main():
     # 初期設定
     s = 3.0
-    v01 = (s, 0.0)     # 最初の辺は右向き
-    p0 = (0.0, 0.0)     # 最初の頂点0
+    n = 10              # 合計10個
     turn_sign = +1      # 必要なら -1 に
-
-    polys = []
-
-    # 1個目
-    poly = build_pentagon_from_edge(p0, v01, turn_sign=turn_sign)
-    polys.append(poly)
+    # 最初の頂点0は原点、最初の辺は右向き (開始角度0°)
 
     # 「3個目の辺」= v2 -> v3
-    e3_start = poly[2]
-    e3_end   = poly[3]
-
     # 以降：その終点(v3)から始めて、終点->始点 へ戻る辺を1本目にする
-    for _ in range(9):  # 合計10個
-        p0_next = e3_end
-        v01_next = sub(e3_start, e3_end)  # v3 -> v2 （戻る）
-
-        poly = build_pentagon_from_edge(p0_next, v01_next, turn_sign=turn_sign)
-        polys.append(poly)
+    # → 1本目の辺の向きは 2×72° (turn_sign 方向) + 180° ずつ回る
+    ext = turn_sign * (2 * math.pi / 5)  # 72°
+    start_angles = np.arange(n) * (2 * ext + math.pi)
 
-        # 次のために更新
-        e3_start = poly[2]
-        e3_end   = poly[3]
+    polys = np.empty((n, 5, 2))
+    build_ring(pentagon_offsets(s, turn_sign), np.cos(start_angles), np.sin(start_angles),
+               True, polys)
 
     closure = norm(sub(polys[-1][0], polys[0][0]))
     print("closure_error(|last.v0 - first.v0|) =", closure)
@@ -1,6 +1,8 @@
 import math
 import numpy as np
 
+from pentagon_kernel import build_ring, pentagon_offsets
+
 class MoroGeometricCore:
     """
     【MORO-Intersection: 構造的収束幾何学エンジン】
@@ -29,40 +31,24 @@ class MoroGeometricCore:
            黄金比に基づいた「ジャンプ（移譲）」により、1ピクセル以下の誤差収束を実現する。
         3. 2n2の萌芽: 各要素は独立した位相を持ちつつ、全体の円環（M）として統合される。
         """
-        all_shapes = []
-        curr_pos = np.array([0.0, 0.0])
-        curr_angle = 0.0
-        
         # 円環を閉じるための基本シフト角（10個の場合、36度が収束の鍵）
         shift_angle = math.radians(360 / n_pentagons)
-
-        for p in range(n_pentagons):
-            points = []
-            temp_pos = curr_pos.copy()
-            temp_angle = curr_angle
-            
-            # 正五角形（Pentagon）の描画プロセス
-            # ここでの72度回転の積み重ねが、最終的に360度の倍数へ「収束」する
-            for i in range(5):
-                points.append(temp_pos.copy())
-                move = np.array([math.cos(temp_angle), math.sin(temp_angle)]) * self.edge_length
-                temp_pos += move
-                temp_angle += math.radians(72)
-            
-            # Intersection（交差）の記録
-            all_shapes.append(np.array(points + [points]))
-            
-            # 【重要】次の五角形への「構造的パス」
-            # 闇雲な接続ではなく、黄金比的な配置関係を保ちながら次位相へ遷移する。
-            # これにより、10ステップ後に浮動小数点の限界を超えて起点へ「帰還」する。
-            jump_angle1 = curr_angle + math.radians(72)
-            next_pos = curr_pos + (np.array([math.cos(curr_angle), math.sin(curr_angle)]) + 
-                                   np.array([math.cos(jump_angle1), math.sin(jump_angle1)])) * self.edge_length
-            
-            curr_pos = next_pos
-            curr_angle += shift_angle
-            
-        return all_shapes
+        start_angles = np.arange(n_pentagons) * shift_angle
+        
+        # 正五角形（Pentagon）の描画プロセス
+        # ここでの72度回転の積み重ねが、最終的に360度の倍数へ「収束」する
+        #
+        # 【重要】次の五角形への「構造的パス」
+        # 闇雲な接続ではなく、黄金比的な配置関係を保ちながら次位相へ遷移する。
+        # （現在の方向ベクトル + 72度回転したベクトルの和によるジャンプ）
+        # これにより、10ステップ後に浮動小数点の限界を超えて起点へ「帰還」する。
+        shapes = np.empty((n_pentagons, 5, 2))
+        build_ring(pentagon_offsets(self.edge_length), np.cos(start_angles), np.sin(start_angles),
+                   False, shapes)
+        
+        # Intersection（交差）の記録: 各要素は5頂点の float 配列 (5×2)
+        # 閉じた輪郭が必要な場合は描画側で先頭の頂点を追加する
+        return list(shapes)
 
     def verify_convergence(self, final_pos):
         """
@@ -70,5 +56,5 @@ class MoroGeometricCore:
         最終的な終点が起点(0,0)に対して1ピクセル（解像度限界）以下に収まっているかを判定。
         これは「計算」の成功ではなく「論理」の勝利を証明する。
         """
-        error = np.linalg.norm(final_pos)
+        error = math.hypot(final_pos[0], final_pos[1])
         return error, error < 1e-12
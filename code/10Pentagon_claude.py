@@ -25,13 +25,16 @@
 import math
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import PolyCollection
+
+from pentagon_kernel import PENTAGON_EXTERIOR_ANGLE, build_ring, pentagon_offsets
 
 
 class PerfectPentagonRing:
     """完璧な五角形円環を生成するクラス"""
     
     # 数学定数
-    PENTAGON_EXTERIOR_ANGLE = 2 * math.pi / 5  # 72° (正五角形の外角)
+    PENTAGON_EXTERIOR_ANGLE = PENTAGON_EXTERIOR_ANGLE  # 72° (正五角形の外角、pentagon_kernel と共通)
     GOLDEN_RATIO = (1 + math.sqrt(5)) / 2      # 黄金比 φ ≈ 1.618
     
     def __init__(self, num_pentagons=10, edge_length=1.0):
@@ -47,108 +50,54 @@ class PerfectPentagonRing:
         # 10個の場合: 360° / 10 = 36°
         self.rotation_per_pentagon = 2 * math.pi / num_pentagons
         
-        # 生成された五角形のリスト
-        self.pentagons = []
+        # 基準となる五角形（開始角度0°）の、開始頂点から見た5頂点のオフセット
+        self._vertex_offsets = pentagon_offsets(edge_length)
+        
+        # 生成された五角形の頂点配列 (num_pentagons×5×2)
+        # 連続した1つの配列として確保し、generate() で上書きする
+        self.pentagons = np.empty((num_pentagons, 5, 2))
         
         # 追跡用
         self.final_position = None
         self.closure_error = None
-    
-    def _build_single_pentagon(self, start_pos, start_angle):
-        """
-        1つの正五角形を構築
         
-        Args:
-            start_pos: 開始位置 (numpy array [x, y])
-            start_angle: 開始角度（ラジアン）
-        
-        Returns:
-            5つの頂点座標を持つ numpy array (5×2)
-        """
-        vertices = []
-        current_pos = start_pos.copy()
-        current_angle = start_angle
+        # 可視化用のカラーマップ: 虹色グラデーション（個数が決まった時点で1回だけ計算）
+        self._colors = plt.cm.rainbow(np.linspace(0, 0.9, num_pentagons))
         
-        # 5つの頂点を順次生成
-        for i in range(5):
-            # 現在位置を記録
-            vertices.append(current_pos.copy())
-            
-            # 次の頂点へ移動
-            displacement = np.array([
-                math.cos(current_angle),
-                math.sin(current_angle)
-            ]) * self.edge_length
-            
-            current_pos += displacement
-            
-            # 次の辺の方向（72°回転）
-            current_angle += self.PENTAGON_EXTERIOR_ANGLE
-        
-        return np.array(vertices)
+        # 可視化用の Figure/Axes（初回の visualize() で作成し、以降は再利用）
+        self._fig = None
+        self._ax = None
     
-    def _calculate_next_position(self, current_pos, current_angle):
+    def generate(self):
         """
-        次の五角形の開始位置を計算
+        完璧な五角形円環を生成
         
         【重要】これが計算誤差ゼロの鍵：
         - 単純に「前の五角形の特定の頂点」を使うのではなく
         - 2つの方向ベクトルの和で幾何学的に正確な位置を計算
         
-        Args:
-            current_pos: 現在の五角形の開始位置
-            current_angle: 現在の角度
-        
-        Returns:
-            次の五角形の開始位置 (numpy array)
-        """
-        # 現在の方向ベクトル
-        vec1 = np.array([
-            math.cos(current_angle),
-            math.sin(current_angle)
-        ])
-        
-        # 72°回転した方向ベクトル
-        angle_plus_72 = current_angle + self.PENTAGON_EXTERIOR_ANGLE
-        vec2 = np.array([
-            math.cos(angle_plus_72),
-            math.sin(angle_plus_72)
-        ])
-        
-        # 2つのベクトルの和
-        # これにより、五角形の幾何学的構造を維持しながら次の位置へ
-        displacement = (vec1 + vec2) * self.edge_length
-        
-        return current_pos + displacement
-    
-    def generate(self):
-        """
-        完璧な五角形円環を生成
+        数値計算は共通の build_ring カーネル（numba があればJITコンパイル）で行う
         
         Returns:
             self (メソッドチェーン用)
         """
-        self.pentagons = []
-        
-        # 初期設定
-        current_pos = np.array([0.0, 0.0])
-        current_angle = 0.0
-        
-        # 各五角形を順次生成
-        for i in range(self.num_pentagons):
-            # i番目の五角形を構築
-            pentagon = self._build_single_pentagon(current_pos, current_angle)
-            self.pentagons.append(pentagon)
-            
-            # 次の五角形のための準備
-            current_pos = self._calculate_next_position(current_pos, current_angle)
-            current_angle += self.rotation_per_pentagon
+        # 全ての開始角度の cos/sin をベクトル化して1回で計算
+        start_angles = np.arange(self.num_pentagons) * self.rotation_per_pentagon
+        
+        # 次の五角形へは2つの方向ベクトルの和でジャンプする
+        final_x, final_y = build_ring(
+            self._vertex_offsets,
+            np.cos(start_angles),
+            np.sin(start_angles),
+            False,
+            self.pentagons
+        )
         
         # 最終位置を記録
-        self.final_position = current_pos
+        self.final_position = np.array([final_x, final_y])
         
         # 収束誤差を計算（原点からの距離）
-        self.closure_error = np.linalg.norm(current_pos)
+        self.closure_error = math.hypot(final_x, final_y)
         
         return self
     
@@ -179,32 +128,33 @@ class PerfectPentagonRing:
             show_numbers: 五角形の番号を表示するか
             show_vertices: 頂点を表示するか
         """
-        if not self.pentagons:
+        if self.closure_error is None:
             raise RuntimeError("先に generate() を実行してください")
         
-        fig, ax = plt.subplots(figsize=(14, 14))
-        
-        # カラーマップ: 虹色グラデーション
-        colors = plt.cm.rainbow(np.linspace(0, 0.9, self.num_pentagons))
-        
-        # 各五角形を描画
-        for idx, pentagon in enumerate(self.pentagons):
-            # 頂点座標（閉じるために最初の点を追加）
-            xs = list(pentagon[:, 0]) + [pentagon[0, 0]]
-            ys = list(pentagon[:, 1]) + [pentagon[0, 1]]
-            
-            # 塗りつぶし
-            ax.fill(xs, ys, alpha=0.6, color=colors[idx], 
-                   edgecolor='black', linewidth=2.5)
-            
-            # 頂点マーカー
-            if show_vertices:
-                ax.plot(xs, ys, 'o', color='darkred', markersize=7,
-                       markeredgecolor='black', markeredgewidth=1.5)
-            
-            # 番号表示
-            if show_numbers:
-                center = pentagon.mean(axis=0)
+        # Figure は使い回し、前回の描画内容だけを消去する
+        if self._fig is None or not plt.fignum_exists(self._fig.number):
+            self._fig, self._ax = plt.subplots(figsize=(14, 14))
+        else:
+            self._ax.clear()
+        fig, ax = self._fig, self._ax
+        
+        # 全ての五角形を1つの PolyCollection でまとめて塗りつぶし
+        ax.add_collection(PolyCollection(
+            self.pentagons, facecolors=self._colors, alpha=0.6,
+            edgecolors='black', linewidths=2.5))
+        ax.autoscale_view()
+        
+        # 頂点マーカー（全頂点を1回の scatter で描画）
+        if show_vertices:
+            all_vertices = self.pentagons.reshape(-1, 2)
+            ax.scatter(all_vertices[:, 0], all_vertices[:, 1],
+                      s=7 ** 2, facecolors='darkred',
+                      edgecolors='black', linewidths=1.5)
+        
+        # 番号表示
+        if show_numbers:
+            centers = self.pentagons.mean(axis=1)
+            for idx, center in enumerate(centers):
                 ax.text(center[0], center[1], str(idx + 1),
                        fontsize=18, fontweight='bold',
                        ha='center', va='center',
@@ -227,9 +177,10 @@ class PerfectPentagonRing:
         ax.set_ylabel('Y', fontsize=14)
         
         # 保存
-        plt.tight_layout()
+        # bbox_inches='tight' は余白計算のために全体を2回描画するため使わない
+        fig.tight_layout()
         output_path = f'/mnt/user-data/outputs/{filename}'
-        plt.savefig(output_path, dpi=dpi, bbox_inches='tight')
+        fig.savefig(output_path, dpi=dpi)
         plt.show()
         
         return output_path
@@ -241,28 +192,24 @@ class PerfectPentagonRing:
         Returns:
             統計情報の辞書
         """
-        if not self.pentagons:
+        if self.closure_error is None:
             raise RuntimeError("先に generate() を実行してください")
         
-        # 全頂点を取得
-        all_vertices = np.vstack(self.pentagons)
+        # 全頂点を取得（コピー不要のビュー）
+        all_vertices = self.pentagons.reshape(-1, 2)
         
-        # 各辺の長さを計算（検証用）
-        edge_lengths = []
-        for pentagon in self.pentagons:
-            for i in range(5):
-                v1 = pentagon[i]
-                v2 = pentagon[(i + 1) % 5]
-                length = np.linalg.norm(v2 - v1)
-                edge_lengths.append(length)
+        # 各辺の長さを一括計算（検証用）
+        # 頂点軸を1つずらして差を取ると、全ての辺ベクトルが得られる
+        edge_vectors = np.roll(self.pentagons, -1, axis=1) - self.pentagons
+        edge_lengths = np.linalg.norm(edge_vectors, axis=-1)
         
         stats = {
             'num_pentagons': self.num_pentagons,
             'num_vertices': len(all_vertices),
-            'edge_length_mean': np.mean(edge_lengths),
-            'edge_length_std': np.std(edge_lengths),
-            'edge_length_min': np.min(edge_lengths),
-            'edge_length_max': np.max(edge_lengths),
+            'edge_length_mean': edge_lengths.mean(),
+            'edge_length_std': edge_lengths.std(),
+            'edge_length_min': edge_lengths.min(),
+            'edge_length_max': edge_lengths.max(),
             'closure_error': self.closure_error,
             'final_position': self.final_position,
         }
@@ -16,6 +16,19 @@ MORO理論に基づく基本的な数値計算ライブラリ
 """
 
 import math
+from functools import lru_cache
+from itertools import accumulate
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba が無い環境では通常の Python 関数としてそのまま実行する
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
 
 
 # ==================== 定数 ====================
@@ -35,15 +48,24 @@ def fibonacci(n):
     
     戻り値: [1, 1, 2, 3, 5, 8, 13, 21, ...]
     """
+    # キャッシュ済みのタプルから新しいリストを返す（呼び出し側の変更がキャッシュに及ばない）
+    return list(_fibonacci_tuple(n))
+
+
+@lru_cache(maxsize=None)
+def _fibonacci_tuple(n):
+    """fibonacci(n) の計算本体（結果はタプルでメモ化）"""
     if n <= 0:
-        return []
+        return ()
     elif n == 1:
-        return [1]
+        return (1,)
     
-    fib = [1, 1]
+    # 事前確保して埋める（append による再確保を避ける）
+    fib = [0] * n
+    fib[0] = fib[1] = 1
     for i in range(2, n):
-        fib.append(fib[-1] + fib[-2])
-    return fib
+        fib[i] = fib[i - 1] + fib[i - 2]
+    return tuple(fib)
 
 
 def lucas(n):
@@ -55,15 +77,61 @@ def lucas(n):
     
     戻り値: [2, 1, 3, 4, 7, 11, 18, 29, ...]
     """
+    return list(_lucas_tuple(n))
+
+
+@lru_cache(maxsize=None)
+def _lucas_tuple(n):
+    """lucas(n) の計算本体（結果はタプルでメモ化）"""
     if n <= 0:
-        return []
+        return ()
     elif n == 1:
-        return [2]
+        return (2,)
     
-    luc = [2, 1]
+    # 事前確保して埋める（append による再確保を避ける）
+    luc = [0] * n
+    luc[0], luc[1] = 2, 1
     for i in range(2, n):
-        luc.append(luc[-1] + luc[-2])
-    return luc
+        luc[i] = luc[i - 1] + luc[i - 2]
+    return tuple(luc)
+
+
+def _fibonacci_pair(n):
+    """
+    高速倍加法で (F(n), F(n+1)) を計算
+    
+    F(2k)   = F(k) × (2F(k+1) - F(k))
+    F(2k+1) = F(k)² + F(k+1)²
+    """
+    if n < 0:
+        raise ValueError("n は 0 以上の整数で指定してください")
+    
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        a, b = (c, d) if bit == '0' else (d, c + d)
+    return a, b
+
+
+def fib_at(n):
+    """
+    n番目のフィボナッチ数 F(n) のみを計算（O(log n) 回の乗算）
+    
+    F(0) = 0, F(1) = 1, F(2) = 1, ...
+    """
+    return _fibonacci_pair(n)[0]
+
+
+def lucas_at(n):
+    """
+    n番目のリュカ数 L(n) のみを計算（O(log n) 回の乗算）
+    
+    L(n) = 2F(n+1) - F(n)
+    L(0) = 2, L(1) = 1, L(2) = 3, ...
+    """
+    f, f_next = _fibonacci_pair(n)
+    return 2 * f_next - f
 
 
 def inverse_fibonacci(n):
@@ -72,8 +140,13 @@ def inverse_fibonacci(n):
     
     戻り値: [55, 34, 21, 13, 8, 5, 3, 2, 1, 1]
     """
-    fib = fibonacci(n)
-    return fib[::-1]
+    return list(_inverse_fibonacci_tuple(n))
+
+
+@lru_cache(maxsize=None)
+def _inverse_fibonacci_tuple(n):
+    """inverse_fibonacci(n) の計算本体（結果はタプルでメモ化）"""
+    return _fibonacci_tuple(n)[::-1]
 
 
 def magic_number(n):
@@ -105,25 +178,25 @@ class B13Number:
         self._normalize()
     
     def _normalize(self):
-        """係数を -6 から +6 の範囲に正規化"""
+        """
+        係数を -6 から +6 の範囲に正規化
+        
+        下位桁から1回走査し、divmod で何桁分の繰り上がりでもまとめて次の桁へ送る
+        （係数は Python の数のまま扱うので、大きな値でも桁あふれしない）
+        """
+        digits = []
         carry = 0
-        for i in range(len(self.coeffs)):
-            total = self.coeffs[i] + carry
-            
-            # -6 から +6 の範囲に収める
-            if total > 6:
-                self.coeffs[i] = total - BASE_13
-                carry = 1
-            elif total < -6:
-                self.coeffs[i] = total + BASE_13
-                carry = -1
-            else:
-                self.coeffs[i] = total
-                carry = 0
+        for c in self.coeffs:
+            # +6 してから13で割ると、余りが 0..12 → -6..+6 に対応する
+            carry, digit = divmod(c + carry + 6, BASE_13)
+            digits.append(digit - 6)
         
-        # 繰り上がりが残っている場合
-        if carry != 0:
-            self.coeffs.append(carry)
+        # 最上位桁からの繰り上がりは桁を追加して受け取る
+        while carry != 0:
+            carry, digit = divmod(carry + 6, BASE_13)
+            digits.append(digit - 6)
+        
+        self.coeffs = digits
         
         # 末尾のゼロを削除
         while len(self.coeffs) > 1 and self.coeffs[-1] == 0:
@@ -260,14 +333,17 @@ def distribute_error_fibonacci(total_error, num_nodes=10):
         各ノードでの補正値のリスト
     """
     fib_weights = inverse_fibonacci(num_nodes)
-    fib_sum = sum(fib_weights)
+    
+    # 残りの重みの合計（接尾辞和）を事前に1回だけ計算
+    # suffix_sums[i] = sum(fib_weights[i:])
+    suffix_sums = list(accumulate(reversed(fib_weights)))[::-1]
     
     corrections = []
     remaining_error = total_error
     
     for i in range(num_nodes):
         # 残りの重みの合計
-        remaining_fib_sum = sum(fib_weights[i:])
+        remaining_fib_sum = suffix_sums[i]
         
         # この時点での補正量
         if remaining_fib_sum > 0:
@@ -286,21 +362,69 @@ def distribute_error_fibonacci(total_error, num_nodes=10):
 
 # ==================== 素数関連 ====================
 
-def is_prime(n):
-    """素数判定"""
+# int64 の数値カーネルに渡す |n| の上限（試し割りの i*i が int64 で桁あふれしない範囲）
+# |n| がこれより大きい場合は Python の整数のまま計算する
+_KERNEL_INT_MAX = 2**62
+
+
+def _is_prime_py(n):
+    """素数判定（6k±1 の候補のみ試し割り）"""
     if n < 2:
         return False
-    if n == 2:
+    if n < 4:
         return True
-    if n % 2 == 0:
+    if n % 2 == 0 or n % 3 == 0:
         return False
     
-    for i in range(3, int(math.sqrt(n)) + 1, 2):
-        if n % i == 0:
+    i = 5
+    while i * i <= n:
+        if n % i == 0 or n % (i + 2) == 0:
             return False
+        i += 6
     return True
 
 
+# 同じ処理の数値カーネル版（numba があれば JIT コンパイルされる）
+_is_prime = njit(cache=True)(_is_prime_py)
+
+
+def is_prime(n):
+    """素数判定"""
+    if abs(n) > _KERNEL_INT_MAX:
+        return _is_prime_py(n)
+    return bool(_is_prime(n))
+
+
+def _prime_sieve(limit):
+    """エラトステネスの篩: 0..limit の各整数が素数かどうかの真偽表"""
+    sieve = np.ones(limit + 1, dtype=bool)
+    sieve[:2] = False
+    
+    for p in range(2, math.isqrt(limit) + 1):
+        if sieve[p]:
+            # p の倍数をまとめて消す（スライス代入）
+            sieve[p * p::p] = False
+    
+    return sieve
+
+
+def _prime_sieve_segment(lo, hi):
+    """
+    区分篩: lo..hi の各整数が素数かどうかの真偽表
+    
+    篩に使う素数は √hi までなので、範囲が狭ければ hi が大きくても軽い
+    """
+    segment = np.ones(hi - lo + 1, dtype=bool)
+    segment[:max(0, 2 - lo)] = False
+    
+    for p in np.flatnonzero(_prime_sieve(math.isqrt(hi))).tolist():
+        # 区間内で最初に消す p の倍数（p² 未満は p より小さい素因数で消えている）
+        first = max(p * p, -(-lo // p) * p)
+        segment[first - lo::p] = False
+    
+    return segment
+
+
 def prime_pairs_in_range(start, end):
     """
     範囲内の素数ペア（双子素数）を探す
@@ -312,18 +436,41 @@ def prime_pairs_in_range(start, end):
     Returns:
         [(p1, p2), ...] 差が2の素数ペア
     """
-    primes = [n for n in range(start, end + 1) if is_prime(n)]
-    pairs = []
+    lo = max(start, 0)
+    if end < 2 or lo > end:
+        return []
     
-    for i in range(len(primes) - 1):
-        if primes[i + 1] - primes[i] == 2:
-            pairs.append((primes[i], primes[i + 1]))
+    # 範囲内の素数を区分篩で一括抽出
+    primes = np.flatnonzero(_prime_sieve_segment(lo, end)) + lo
     
-    return pairs
+    # 隣接する素数の差が2の位置を探す
+    twin = np.flatnonzero(np.diff(primes) == 2)
+    return list(zip(primes[twin].tolist(), primes[twin + 1].tolist()))
 
 
-def prime_factorization(n):
-    """素因数分解"""
+@njit(cache=True)
+def _prime_factorization(n):
+    """素因数分解の数値カーネル（n ≤ 2**62 なので素因数は高々62個）"""
+    factors = np.empty(64, dtype=np.int64)
+    count = 0
+    d = 2
+    
+    while d * d <= n:
+        while n % d == 0:
+            factors[count] = d
+            count += 1
+            n //= d
+        d += 1
+    
+    if n > 1:
+        factors[count] = n
+        count += 1
+    
+    return factors[:count]
+
+
+def _prime_factorization_py(n):
+    """素因数分解（int64 に収まらない n 用、Python の整数のまま計算）"""
     factors = []
     d = 2
     
@@ -339,6 +486,13 @@ def prime_factorization(n):
     return factors
 
 
+def prime_factorization(n):
+    """素因数分解"""
+    if abs(n) > _KERNEL_INT_MAX:
+        return _prime_factorization_py(n)
+    return _prime_factorization(n).tolist()
+
+
 # ==================== ユーティリティ ====================
 
 def fibonacci_ratio_convergence(n=20):
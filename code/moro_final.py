@@ -1,67 +1,206 @@
+import importlib.util
+import shutil
+import subprocess
+
 import matplotlib.pyplot as plt
 import numpy as np
+import matplotlib.colors as mcolors
+from matplotlib.collections import PolyCollection
 from PIL import Image
-from IPython.display import Image as IPImage
+from IPython.display import Image as IPImage, Video
+
+# MP4 の書き出しには imageio と ffmpeg 本体 (imageio-ffmpeg) の両方が必要
+# 無い環境では従来どおり GIF を書き出す
+if importlib.util.find_spec('imageio') and importlib.util.find_spec('imageio_ffmpeg'):
+    import imageio.v2 as iio
+else:
+    iio = None
+
+try:
+    from numba import njit
+except ImportError:
+    # numba が無い環境では通常の Python 関数としてそのまま実行する
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
 
-# 正五角形の座標計算
-def get_pentagon(cx, cy, radius, rot_degree):
-    angles = np.linspace(0, 2*np.pi, 6) + np.radians(rot_degree)
-    return cx + radius * np.cos(angles), cy + radius * np.sin(angles)
+# 正五角形の頂点角度 (5点。閉じる辺は描画側の閉じたパスで引く): 起動時に1回だけ計算
+BASE_ANGLES = np.linspace(0, 2*np.pi, 6)[:5]
+DEG2RAD = np.pi / 180.0 # 度 -> ラジアン (np.radians の呼び出しを省く)
 
 plt.style.use('dark_background')
-frames = []
 phi = (1 + 5**0.5) / 2 # 黄金比
 
-# 60フレームの生成
-for frame in range(60):
-    fig, (ax_plot, ax_text) = plt.subplots(1, 2, figsize=(10, 5), gridspec_kw={'width_ratios': [1.2, 1]})
-    ax_plot.set_xlim(-4, 4); ax_plot.set_ylim(-4, 4); ax_plot.set_aspect('equal')
-    ax_text.axis('off')
-
-    if frame < 20:
-        # 1. DECIMAL (10進法: 画像手前の金色の台座)
-        for i in range(3):
-            x, y = get_pentagon(0, 0, 2.0, i * 108 + 90)
-            ax_plot.plot(x, y, color='#D4AF37', lw=2.5)
-        ax_plot.text(0, -0.5, "GAP: 36 deg", color='red', ha='center', fontweight='bold')
-        msg = "1. DECIMAL SYSTEM\n\nGap: 36 deg\n108*3 = 324 (Not 360)\nGeometry mismatch."
-
-    elif frame < 40:
-        # 2. QUINARY (5進法: 2n2/B13 浮遊五角形)
-        for i in range(5):
-            angle = i * 72
-            cx, cy = 2.2 * np.cos(np.radians(angle)), 2.2 * np.sin(np.radians(angle))
-            x, y = get_pentagon(cx, cy, 0.8, angle)
-            ax_plot.plot(x, y, color='#9370DB', lw=1.5)
-        msg = "2. QUINARY (2n2/B13)\n\nIndependent units.\nSymmetry is high,\nbut connectivity is low."
+# 台座の五角形 (10進法): 108度ずつ回した3個
+DECIMAL_ROTS = (np.arange(3) * 108 + 90) * DEG2RAD
 
-    else:
-        # 3. REFLECTED FIBONACCI (画像中央のMORO螺旋)
-        for i in range(frame - 35):
-            scale = 3.5 * (1 / phi**(i * 0.3))
-            x, y = get_pentagon(0, 0, scale, i * 22.5)
-            ax_plot.plot(x, y, color=plt.cm.plasma(i/25), lw=1, alpha=0.8)
-        msg = "3. REFLECTED FIBONACCI\n\nCorrection via Phi.\nSpiral fills the gap.\nMORO convergence."
-
-    ax_text.text(0, 0.5, msg, fontsize=11, color='white', family='monospace')
-    
-    # 画像変換 (Matplotlib -> PIL)
+# 浮遊五角形 (5進法) の配置: 72度おきに半径 2.2 の円周上へ並べる
+ANGLES_Q = np.arange(5) * 72 * DEG2RAD
+CX_Q = 2.2 * np.cos(ANGLES_Q)
+CY_Q = 2.2 * np.sin(ANGLES_Q)
+
+# 螺旋の五角形 (最大25個)
+# i番目: 半径 3.5/φ^(0.3i), 回転 22.5i 度
+SPIRAL_COUNT = 25
+SCALES = 3.5 / phi**(np.arange(SPIRAL_COUNT) * 0.3)
+ROTS = np.arange(SPIRAL_COUNT) * 22.5 * DEG2RAD
+
+# N個の五角形の頂点 (N×5×2) を計算する (中心 cx, cy・半径・回転角はそれぞれ長さNの配列)
+@njit(cache=True)
+def pentagon_table(base_angles, cx, cy, radius, rot):
+    table = np.empty((cx.shape[0], base_angles.shape[0], 2))
+    for i in range(cx.shape[0]):
+        for k in range(base_angles.shape[0]):
+            table[i, k, 0] = cx[i] + radius[i] * np.cos(base_angles[k] + rot[i])
+            table[i, k, 1] = cy[i] + radius[i] * np.sin(base_angles[k] + rot[i])
+    return table
+
+# 各フェーズで使う五角形の頂点をまとめて計算する数値カーネル (numba があれば JIT コンパイルされる)
+# 同じ五角形はどのフレームでも同じ頂点なので、三角関数はフェーズ毎に1回だけ計算する
+# 戻り値: 台座 (3×5×2)・浮遊五角形 (5×5×2)・螺旋 (25×5×2) の頂点
+@njit(cache=True)
+def build_geometry(base_angles, decimal_rots, cx_q, cy_q, angles_q, scales, rots):
+    zeros = np.zeros(SPIRAL_COUNT)
+    decimal = pentagon_table(base_angles, zeros[:3], zeros[:3], np.full(3, 2.0), decimal_rots)
+    quinary = pentagon_table(base_angles, cx_q, cy_q, np.full(5, 0.8), angles_q)
+    spiral = pentagon_table(base_angles, zeros, zeros, scales, rots)
+    return decimal, quinary, spiral
+
+# 全フェーズの頂点を起動時に一括計算 (描画側はフェーズ毎の配列を受け取って使うだけ)
+DECIMAL_PENTAGONS, QUINARY_PENTAGONS, SPIRAL_PENTAGONS = build_geometry(
+    BASE_ANGLES, DECIMAL_ROTS, CX_Q, CY_Q, ANGLES_Q, SCALES, ROTS)
+
+# 描画色は起動時に1回だけ RGBA へ変換しておく (描画時の色文字列の解析を省く)
+PLASMA_LUT = plt.cm.plasma(np.arange(SPIRAL_COUNT) / 25) # 螺旋の色 (i/25): (25×4)
+GOLD = mcolors.to_rgba('#D4AF37')
+PURPLE = mcolors.to_rgba('#9370DB')
+RED = mcolors.to_rgba('red')
+WHITE = mcolors.to_rgba('white')
+
+# GIF 共通パレット: 黒背景に対する各描画色の濃淡 (アンチエイリアス分) を8段階ずつ並べる
+# 全フレームをこの1つのパレットへ対応付けるだけなので、フレーム毎の減色計算が不要になる
+palette_keys = [c[:3] for c in (WHITE, RED, GOLD, PURPLE)] + [tuple(c[:3]) for c in PLASMA_LUT]
+palette_rgb = np.zeros((256, 3))
+palette_rgb[1:1 + 8 * len(palette_keys)] = (np.array(palette_keys)[:, None, :] * (np.arange(1, 9) / 8)[:, None]).reshape(-1, 3)
+GIF_PALETTE_RGB = np.round(palette_rgb * 255).astype(np.uint8) # パレット番号 -> RGB の表 (256×3)
+GIF_PALETTE = Image.new('P', (1, 1))
+GIF_PALETTE.putpalette(GIF_PALETTE_RGB.ravel().tolist())
+
+# Figure は1回だけ作成し、全フレームで使い回す
+# GIF の解像度で直接描画する (DPI 60: 600×300。描画・減色・圧縮の画素数が 100 の時の約1/3)
+DPI = 60
+fig, (ax_plot, ax_text) = plt.subplots(1, 2, figsize=(10, 5), dpi=DPI, gridspec_kw={'width_ratios': [1.2, 1]})
+# 軸の範囲・目盛りは全フェーズ共通なので最初に1回だけ設定する
+ax_plot.set_xlim(-4, 4); ax_plot.set_ylim(-4, 4); ax_plot.set_aspect('equal')
+ax_text.axis('off')
+
+# 軸の初期化 (前のフェーズで追加した五角形と文字だけを消す)
+# cla() で軸・目盛り・目盛りラベルまで作り直すと、変化しない文字のレイアウトを毎回やり直すことになる
+def reset_axes():
+    for artist in [*ax_plot.collections, *ax_plot.texts, *ax_text.texts]:
+        artist.remove()
+
+# 画像変換 (Matplotlib -> 共通パレットへ減色し、パレット番号の配列 (h×w, uint8) を返す)
+# 背景は不透明なので、RGBA バッファのアルファを切り落とすだけで RGB になる
+# redraw=False のときは Figure 全体を描き直さず、現在のキャンバスをそのまま取り込む
+def capture_frame(redraw=True):
+    # 描画は draw() の1回だけ。print_to_buffer() は同じ描画の後にバッファ全体を bytes へ
+    # コピーするだけなので使わず、レンダラのバッファを (h, w, 4) のビューとして直接読む
+    if redraw:
+        fig.canvas.draw()
+    rgba = np.asarray(fig.canvas.buffer_rgba())
+    image = Image.fromarray(np.ascontiguousarray(rgba[..., :3]))
+    return np.asarray(image.quantize(palette=GIF_PALETTE, dither=Image.Dither.NONE))
+
+# 1. DECIMAL (10進法: 画像手前の金色の台座): 0〜19 フレームは同じ絵なので1枚だけ描画する
+def render_decimal_frames(pentagons):
+    reset_axes()
+    ax_plot.add_collection(PolyCollection(pentagons, closed=True, facecolors='none', edgecolors=[GOLD], linewidths=2.5))
+    ax_plot.text(0, -0.5, "GAP: 36 deg", color=RED, ha='center', fontweight='bold')
+    msg = "1. DECIMAL SYSTEM\n\nGap: 36 deg\n108*3 = 324 (Not 360)\nGeometry mismatch."
+    ax_text.text(0, 0.5, msg, fontsize=11, color=WHITE, family='monospace')
+    return capture_frame()[None]
+
+# 2. QUINARY (5進法: 2n2/B13 浮遊五角形): 20〜39 フレームも同じ絵なので1枚だけ描画する
+def render_quinary_frames(pentagons):
+    reset_axes()
+    ax_plot.add_collection(PolyCollection(pentagons, closed=True, facecolors='none', edgecolors=[PURPLE], linewidths=1.5))
+    msg = "2. QUINARY (2n2/B13)\n\nIndependent units.\nSymmetry is high,\nbut connectivity is low."
+    ax_text.text(0, 0.5, msg, fontsize=11, color=WHITE, family='monospace')
+    return capture_frame()[None]
+
+# 3. REFLECTED FIBONACCI (画像中央のMORO螺旋): 40〜59 フレームを順に描画
+# 描いた五角形は軸に残し、毎フレーム新しい1個だけを追加する (フレーム f は先頭 f-35 個)
+def render_fibonacci_frames(pentagons):
+    reset_axes()
+    msg = "3. REFLECTED FIBONACCI\n\nCorrection via Phi.\nSpiral fills the gap.\nMORO convergence."
+    ax_text.text(0, 0.5, msg, fontsize=11, color=WHITE, family='monospace')
+
+    # 軸・文字などの変化しない部分は最初に1回だけ描画し、
+    # 以降は追加した五角形だけを描画済みのキャンバスへ重ね描きする (blit)
     fig.canvas.draw()
-    rgba_buffer = fig.canvas.buffer_rgba()
-    image = Image.frombuffer('RGBA', fig.canvas.get_width_height(), rgba_buffer, 'raw', 'RGBA', 0, 1).convert('RGB')
-    frames.append(image)
+    w, h = fig.canvas.get_width_height(physical=True)
+    images = np.empty((20, h, w), np.uint8)
+    drawn = 0
+    for frame in range(40, 60):
+        count = frame - 35
+        collection = ax_plot.add_collection(PolyCollection(
+            pentagons[drawn:count], closed=True, facecolors='none',
+            edgecolors=PLASMA_LUT[drawn:count], linewidths=1, alpha=0.8))
+        ax_plot.draw_artist(collection)
+        drawn = count
+        np.copyto(images[frame - 40], capture_frame(redraw=False))
+    return images
+
+if __name__ == '__main__':
+    # 60フレームの生成: 3つのフェーズを順に描画する
+    # 0〜19 と 20〜39 はそれぞれ同じ絵なので1回ずつだけ描画し、表示時間を20フレーム分にする
+    frame_ms = 150
+    durations = [frame_ms * 20, frame_ms * 20] + [frame_ms] * 20
+    # 全フレームを1つの配列 (フレーム数×h×w, パレット番号) に確保し、描画結果を直接書き込む
+    w, h = fig.canvas.get_width_height(physical=True)
+    frames = np.empty((len(durations), h, w), np.uint8)
+    np.concatenate([render_decimal_frames(DECIMAL_PENTAGONS),
+                    render_quinary_frames(QUINARY_PENTAGONS),
+                    render_fibonacci_frames(SPIRAL_PENTAGONS)], out=frames)
     plt.close(fig)
 
-# 【修正箇所】リストの最初の画像オブジェクトに対してsaveを呼び出す
-gif_name = 'moro_final.gif'
-if frames:
-    frames[0].save(
-        gif_name, 
-        save_all=True, 
-        append_images=frames[1:], 
-        duration=150, 
-        loop=0
-    )
-
-# 表示 (タブレットでも画像として表示される)
-display(IPImage(filename=gif_name))
+    if iio is not None:
+        # MP4 (libx264) で書き出す: 動画は一定フレームレートなので、静止フレームは表示時間分だけ繰り返す
+        video_name = 'moro_final.mp4'
+        with iio.get_writer(video_name, fps=1000 / frame_ms, codec='libx264', quality=8,
+                            macro_block_size=2) as writer:
+            # パレット番号 -> RGB は全フレームまとめて表引きする
+            for rgb, duration in zip(GIF_PALETTE_RGB[frames], durations):
+                for _ in range(duration // frame_ms):
+                    writer.append_data(rgb)
+
+        # 表示 (動画をノートブックに埋め込む)
+        display(Video(video_name, embed=True))
+
+    else:
+        # 【修正箇所】リストの最初の画像オブジェクトに対してsaveを呼び出す
+        # Pillow は前フレームから変化した矩形だけを切り出して書き込む (disposal=1: 前フレームの上に重ねる)
+        gif_name = 'moro_final.gif'
+        # 保存する時だけ各フレームを PIL 画像 (共通パレット付き) で包む
+        palette = GIF_PALETTE_RGB.ravel().tolist()
+        images = [Image.fromarray(frame) for frame in frames]
+        for image in images:
+            image.putpalette(palette)
+        if images:
+            images[0].save(
+                gif_name, 
+                save_all=True, 
+                append_images=images[1:], 
+                duration=durations, 
+                loop=0,
+                optimize=False,
+                disposal=1
+            )
+            # gifsicle があればフレーム間最適化を追加でかける (画質は変わらない)
+            if shutil.which('gifsicle'):
+                subprocess.run(['gifsicle', '--batch', '-O3', gif_name], check=True)
+
+        # 表示 (タブレットでも画像として表示される)
+        display(IPImage(filename=gif_name))
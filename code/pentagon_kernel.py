@@ -0,0 +1,93 @@
+"""
+五角形円環の共通数値カーネル
+==========================================
+
+10Pentagon_claude.py / 10Pentagon_GPT.py などが共有する
+「72°ずつ回って正五角形を作り、次の五角形へ移る」計算を1か所にまとめたもの。
+
+【構成】
+- pentagon_offsets: 基準の正五角形（開始角度0°）の頂点オフセット
+- build_ring: 円環の全頂点を配列へ直接書き込む数値カーネル
+  （numba があれば JIT コンパイルされる）
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba が無い環境では通常の Python 関数としてそのまま実行する
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+PENTAGON_EXTERIOR_ANGLE = 2 * math.pi / 5  # 72° (正五角形の外角)
+
+
+def pentagon_offsets(edge_length=1.0, turn_sign=+1):
+    """
+    基準となる正五角形（開始角度0°）の、開始頂点から見た5頂点のオフセット
+
+    Args:
+        edge_length: 各辺の長さ
+        turn_sign: +1 で CCW に 72°ずつ回す、-1 で CW
+
+    Returns:
+        頂点オフセットの numpy array (5×2)
+    """
+    # 辺ベクトル: 72°ずつ回転した5方向
+    edge_angles = np.arange(5) * (turn_sign * PENTAGON_EXTERIOR_ANGLE)
+    edge_dirs = np.column_stack([
+        np.cos(edge_angles),
+        np.sin(edge_angles)
+    ]) * edge_length
+
+    # 辺ベクトルの累積和が各頂点の位置
+    return np.vstack([
+        [0.0, 0.0],
+        np.cumsum(edge_dirs[:4], axis=0)
+    ])
+
+
+@njit(cache=True)
+def build_ring(vertex_offsets, cos_start, sin_start, return_along_third_edge, out):
+    """
+    円環の全頂点を out に直接書き込む数値カーネル
+
+    k番目の五角形は、基準五角形を開始角度だけ回転させて開始位置へ置いたもの。
+    次の五角形の開始位置は return_along_third_edge で切り替える:
+    - False: 現在の方向ベクトル + 72°回転した方向ベクトル（2つの辺ベクトルの和）
+    - True: 3番目の辺 (頂点2 → 頂点3) の終点
+
+    Args:
+        vertex_offsets: 基準五角形の頂点オフセット (5×2)
+        cos_start: 各五角形の開始角度の cos (N,)
+        sin_start: 各五角形の開始角度の sin (N,)
+        return_along_third_edge: 3番目の辺を戻って次の五角形を始めるか
+        out: 書き込み先の配列 (N×5×2)
+
+    Returns:
+        円環を一周した後の最終位置 (x, y)
+    """
+    link = 3 if return_along_third_edge else 2
+    jx, jy = vertex_offsets[link, 0], vertex_offsets[link, 1]
+    px, py = 0.0, 0.0
+
+    for k in range(out.shape[0]):
+        # k番目の五角形の開始角度（三角関数は呼び出し側で一括計算済み）
+        c, s = cos_start[k], sin_start[k]
+
+        # 基準の五角形を回転させ、開始位置へ平行移動
+        for i in range(5):
+            ox, oy = vertex_offsets[i, 0], vertex_offsets[i, 1]
+            out[k, i, 0] = px + c * ox - s * oy
+            out[k, i, 1] = py + s * ox + c * oy
+
+        # 次の五角形の開始位置へ「ジャンプ」
+        px += c * jx - s * jy
+        py += s * jx + c * jy
+
+    return px, py